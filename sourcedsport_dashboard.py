@@ -27,11 +27,35 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime
 import io
 
+# Optional JIT accelerator for the batch ACWR recurrence. The app works
+# without it; with numba installed the per-player EWMA loop compiles to
+# parallel machine code for large-team datasets.
+try:
+    import numba as nb
+    _HAS_NUMBA = True
+except ImportError:
+    nb = None
+    _HAS_NUMBA = False
+
+# PyArrow parses CSV on multiple threads, several times faster than
+# pandas' single-threaded C engine on multi-MB GPS exports.
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    _HAS_PYARROW = True
+except ImportError:
+    pa = pacsv = None
+    _HAS_PYARROW = False
+
+# Rows per chunk for the streaming pandas CSV fallback
+_CSV_CHUNK_ROWS = 200_000
+
 # =============================================================================
 # PAGE CONFIG & STYLING
 # =============================================================================
@@ -156,6 +180,21 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Shared dark chart layout, registered once at import. Figures reference
+# it by name instead of rebuilding the same layout dicts on every rerun,
+# which also keeps the figure JSON sent to the browser smaller.
+pio.templates["sourced"] = go.layout.Template(layout=dict(
+    plot_bgcolor="rgba(0,0,0,0)",
+    paper_bgcolor="rgba(0,0,0,0)",
+    font=dict(color="#e2e8f0"),
+    xaxis=dict(gridcolor="#334155"),
+    yaxis=dict(gridcolor="#334155"),
+    polar=dict(
+        bgcolor="rgba(0,0,0,0)",
+        radialaxis=dict(gridcolor="#334155")
+    )
+))
+
 
 # =============================================================================
 # BENCHMARK DATA (Evidence-based from Buchheit, Laursen et al.)
@@ -224,6 +263,22 @@ FIELD_HOCKEY_BENCHMARKS = {
     }
 }
 
+# Structure-of-arrays view of the benchmarks for vectorized lookups:
+# one array per bound, indexed by METRIC_IDX[metric]. Derived from
+# FIELD_HOCKEY_BENCHMARKS at import time so the dict above stays the
+# single place to customize targets (see README).
+METRIC_IDX = {metric: i for i, metric in enumerate(FIELD_HOCKEY_BENCHMARKS)}
+_BOUNDS = list(FIELD_HOCKEY_BENCHMARKS.values())
+RED_LOW = np.array([b["red_low"] for b in _BOUNDS], dtype=np.float64)
+RED_HIGH = np.array([b["red_high"] for b in _BOUNDS], dtype=np.float64)
+ORANGE_LO = np.array([b["orange"][0] for b in _BOUNDS], dtype=np.float64)
+ORANGE_HI = np.array([b["orange"][1] for b in _BOUNDS], dtype=np.float64)
+YELLOW_LO = np.array([b["yellow"][0] for b in _BOUNDS], dtype=np.float64)
+YELLOW_HI = np.array([b["yellow"][1] for b in _BOUNDS], dtype=np.float64)
+GREEN_LO = np.array([b["green"][0] for b in _BOUNDS], dtype=np.float64)
+GREEN_HI = np.array([b["green"][1] for b in _BOUNDS], dtype=np.float64)
+del _BOUNDS
+
 ACWR_ZONES = {
     "green": (0.8, 1.3),     # Optimal zone
     "yellow_low": (0.6, 0.8),  # Undertraining risk
@@ -237,29 +292,52 @@ ACWR_ZONES = {
 # HELPER FUNCTIONS
 # =============================================================================
 
+def classify_metric(values, metric):
+    """Classify an array of metric values into traffic light colors.
+
+    Vectorized with np.select over the benchmark bounds so whole
+    columns can be classified in a single pass instead of per-value
+    if/elif chains. Bounds come from the SoA benchmark arrays, so the
+    hot path is scalar array indexing rather than nested dict lookups.
+    """
+    idx = METRIC_IDX.get(metric)
+
+    if idx is None:
+        return np.full(np.shape(values), "gray")
+
+    values = np.asarray(values, dtype=float)
+
+    conditions = [
+        (values < RED_LOW[idx]) | (values > RED_HIGH[idx]),
+        (values >= ORANGE_LO[idx]) & (values <= ORANGE_HI[idx]),
+        (values >= YELLOW_LO[idx]) & (values <= YELLOW_HI[idx]),
+        (values >= GREEN_LO[idx]) & (values <= GREEN_HI[idx]),
+    ]
+    return np.select(conditions, ["red", "orange", "yellow", "green"], default="yellow")
+
+
+def classify_metrics_batch(values, metrics):
+    """Classify one value per metric in a single np.select pass.
+
+    `values` and `metrics` are parallel sequences; the bounds for each
+    position are gathered from the SoA benchmark arrays by metric id,
+    so n metrics cost one comparison batch instead of n calls.
+    """
+    idx = np.array([METRIC_IDX[m] for m in metrics])
+    values = np.asarray(values, dtype=float)
+
+    conditions = [
+        (values < RED_LOW[idx]) | (values > RED_HIGH[idx]),
+        (values >= ORANGE_LO[idx]) & (values <= ORANGE_HI[idx]),
+        (values >= YELLOW_LO[idx]) & (values <= YELLOW_HI[idx]),
+        (values >= GREEN_LO[idx]) & (values <= GREEN_HI[idx]),
+    ]
+    return np.select(conditions, ["red", "orange", "yellow", "green"], default="yellow")
+
+
 def get_traffic_light(value, metric):
     """Return traffic light color based on value and metric benchmarks."""
-    benchmarks = FIELD_HOCKEY_BENCHMARKS.get(metric, {})
-    
-    if not benchmarks:
-        return "gray"
-    
-    green = benchmarks.get("green", (0, 0))
-    yellow = benchmarks.get("yellow", (0, 0))
-    orange = benchmarks.get("orange", (0, 0))
-    red_high = benchmarks.get("red_high", float('inf'))
-    red_low = benchmarks.get("red_low", 0)
-    
-    if value < red_low or value > red_high:
-        return "red"
-    elif orange[0] <= value <= orange[1]:
-        return "orange"
-    elif yellow[0] <= value <= yellow[1]:
-        return "yellow"
-    elif green[0] <= value <= green[1]:
-        return "green"
-    else:
-        return "yellow"
+    return str(classify_metric(np.array([value]), metric)[0])
 
 
 def get_acwr_status(acwr):
@@ -306,59 +384,196 @@ def calculate_acwr(weekly_loads, acute_weeks=1, chronic_weeks=4):
     return acute_load / chronic_ewma
 
 
+def _acwr_batch(loads, chronic_lambda):
+    """Run the EWMA ACWR recurrence over a (n_players, n_weeks) matrix.
+
+    The acute load is strictly the latest week (the last column):
+    players with no data in that week get NaN, mirroring the pandas
+    `wide.iloc[-1] / chronic.iloc[-1]` path. NaN entries elsewhere
+    (weeks without data for a player) are skipped in the chronic
+    recurrence, matching `ewm(..., ignore_na=True)`. JIT-compiled
+    with numba when available (see module import).
+    """
+    n_players, n_weeks = loads.shape
+    out = np.empty(n_players)
+    for p in _prange(n_players):
+        chronic = np.nan
+        for w in range(n_weeks):
+            load = loads[p, w]
+            if np.isnan(load):
+                continue
+            if np.isnan(chronic):
+                chronic = load
+            else:
+                chronic = load * chronic_lambda + chronic * (1 - chronic_lambda)
+        acute = loads[p, n_weeks - 1]
+        out[p] = acute / chronic if chronic > 0 else np.nan
+    return out
+
+
+if _HAS_NUMBA:
+    _prange = nb.prange
+    # No fastmath: its nnan/ninf flags can fold away the isnan checks
+    # and NaN comparisons the kernel's gap handling depends on
+    _acwr_batch = nb.njit(parallel=True, cache=True)(_acwr_batch)
+else:
+    _prange = range
+
+
+@st.cache_data(show_spinner=False)
 def generate_sample_data(n_players=20, n_weeks=8):
-    """Generate realistic sample GPS data for demonstration."""
-    np.random.seed(42)
-    
-    players = [f"Player {i+1}" for i in range(n_players)]
+    """Generate realistic sample GPS data for demonstration.
+
+    Fully vectorized: all per-session factors are computed as NumPy
+    arrays of shape (n_weeks, 4 sessions, n_players) and combined via
+    broadcasting, so no per-row Python loop is needed.
+
+    Cached with st.cache_data so the demo DataFrame is built once and
+    reused across Streamlit reruns instead of regenerated on every
+    widget interaction.
+    """
+    rng = np.random.default_rng(42)
+    n_sessions = 4  # sessions per week, last one is the match
+
+    players = np.array([f"Player {i+1}" for i in range(n_players)])
     positions = ["GK", "DEF", "DEF", "DEF", "MID", "MID", "MID", "MID", "FWD", "FWD"]
-    
-    data = []
-    start_date = datetime.now() - timedelta(weeks=n_weeks)
-    
-    for week in range(n_weeks):
-        for session in range(4):  # 4 sessions per week
-            session_date = start_date + timedelta(weeks=week, days=session*2)
-            session_type = "Match" if session == 3 else "Training"
-            
-            for player in players:
-                # Base values with position variation
-                pos = positions[players.index(player) % len(positions)]
-                pos_factor = 1.0 if pos == "MID" else 0.9 if pos in ["DEF", "FWD"] else 0.6
-                
-                # Match vs training factor
-                match_factor = 1.3 if session_type == "Match" else 1.0
-                
-                # Progressive overload simulation
-                week_factor = 0.85 + (week / n_weeks) * 0.3
-                
-                # Random variation
-                rand_factor = np.random.uniform(0.85, 1.15)
-                
-                combined = pos_factor * match_factor * week_factor * rand_factor
-                
-                data.append({
-                    "Date": session_date.strftime("%Y-%m-%d"),
-                    "Player": player,
-                    "Position": pos,
-                    "Session Type": session_type,
-                    "Duration (min)": int(90 * match_factor * np.random.uniform(0.9, 1.1)),
-                    "Total Distance (m)": int(6500 * combined),
-                    "HSR Distance (m)": int(1200 * combined),
-                    "Sprint Distance (m)": int(300 * combined),
-                    "Accelerations": int(60 * combined),
-                    "Decelerations": int(55 * combined),
-                    "Player Load (AU)": round(650 * combined, 1),
-                    "Max Speed (km/h)": round(28 + np.random.uniform(-3, 3), 1)
-                })
-    
-    return pd.DataFrame(data)
+    player_positions = np.array([positions[i % len(positions)] for i in range(n_players)])
+
+    # Per-player position factor, shape (n_players,)
+    pos_factor = np.where(
+        player_positions == "MID", 1.0,
+        np.where(np.isin(player_positions, ["DEF", "FWD"]), 0.9, 0.6)
+    )
+
+    # Match vs training factor, shape (1, n_sessions, 1)
+    match_factor = np.array([1.0] * (n_sessions - 1) + [1.3])[None, :, None]
+
+    # Progressive overload simulation, shape (n_weeks, 1, 1)
+    week_factor = (0.85 + np.arange(n_weeks) / n_weeks * 0.3)[:, None, None]
+
+    # Random variation, shape (n_weeks, n_sessions, n_players)
+    rand_factor = rng.uniform(0.85, 1.15, size=(n_weeks, n_sessions, n_players))
+
+    combined = (pos_factor * match_factor * week_factor * rand_factor).ravel()
+
+    # Session dates: one per (week, session), repeated across players
+    start_date = pd.Timestamp.now().normalize() - pd.Timedelta(weeks=n_weeks)
+    day_offsets = (np.arange(n_weeks)[:, None] * 7 + np.arange(n_sessions)[None, :] * 2).ravel()
+    dates = np.repeat(start_date + pd.to_timedelta(day_offsets, unit="D"), n_players)
+
+    session_types = np.tile(
+        np.repeat(np.array(["Training"] * (n_sessions - 1) + ["Match"]), n_players),
+        n_weeks
+    )
+
+    duration = (
+        90 * match_factor * rng.uniform(0.9, 1.1, size=(n_weeks, n_sessions, n_players))
+    ).ravel()
+
+    # Columnar arrays with explicit compact dtypes: pandas adopts them
+    # without an AoS->SoA transpose or default int64/float64 widths,
+    # and categoricals match what the CSV ingestion path produces
+    df = pd.DataFrame({
+        "Date": dates,
+        "Player": pd.Categorical(np.tile(players, n_weeks * n_sessions)),
+        "Position": pd.Categorical(np.tile(player_positions, n_weeks * n_sessions)),
+        "Session Type": pd.Categorical(session_types),
+        "Duration (min)": duration.astype(np.int32),
+        "Total Distance (m)": (6500 * combined).astype(np.int32),
+        "HSR Distance (m)": (1200 * combined).astype(np.int32),
+        "Sprint Distance (m)": (300 * combined).astype(np.int32),
+        "Accelerations": (60 * combined).astype(np.int32),
+        "Decelerations": (55 * combined).astype(np.int32),
+        "Player Load (AU)": np.round(650 * combined, 1).astype(np.float32),
+        "Max Speed (km/h)": np.round(
+            28 + rng.uniform(-3, 3, size=combined.shape), 1
+        ).astype(np.float32)
+    })
+
+    # Precompute the ISO week inside the cached scope; the weekly
+    # chart and ACWR monitor consume this column directly
+    df["_week"] = df["Date"].dt.to_period("W")
+
+    return df
+
+
+@st.cache_resource(show_spinner=False)
+def _group_by_player(df):
+    """Split the frame into per-player groups, cached per DataFrame.
+
+    Selecting a player becomes a dict lookup instead of a full-column
+    `df[df["Player"] == p]` mask scan on every rerun. cache_resource
+    (not cache_data) so the dict is returned by reference instead of
+    being re-pickled on every access; callers must not mutate the
+    groups (render_individual_player's sort_values already copies).
+    """
+    return {
+        player: group
+        for player, group in df.groupby("Player", sort=False, observed=True)
+    }
 
 
 def parse_uploaded_data(uploaded_file):
-    """Parse uploaded CSV file and standardize column names."""
-    df = pd.read_csv(uploaded_file)
-    
+    """Parse uploaded CSV file and standardize column names.
+
+    Reads the file bytes up front so the cached parser is keyed on the
+    file content hash — reruns with the same upload skip the parse.
+    """
+    return _parse_csv_bytes(uploaded_file.getvalue())
+
+
+@st.cache_data(show_spinner=False)
+def _parse_csv_bytes(data):
+    """Parse raw CSV bytes and standardize column names (cached).
+
+    The CSV is consumed as a stream of chunks, each downcast before
+    the next is parsed, so peak memory stays near one chunk of
+    full-width float64/int64 data instead of the whole export.
+    """
+    chunks = []
+    if _HAS_PYARROW:
+        try:
+            with pacsv.open_csv(io.BytesIO(data)) as reader:
+                for batch in reader:
+                    chunks.append(
+                        _downcast_numerics(pa.Table.from_batches([batch]).to_pandas())
+                    )
+        except pa.ArrowInvalid:
+            # Unusual delimiters/quoting: fall back to pandas below
+            chunks = []
+
+    if not chunks:
+        with pd.read_csv(io.BytesIO(data), chunksize=_CSV_CHUNK_ROWS) as reader:
+            for chunk in reader:
+                chunks.append(_downcast_numerics(chunk))
+
+    if not chunks:
+        # Header-only file: parse it whole for an empty frame
+        df = pd.read_csv(io.BytesIO(data))
+    elif len(chunks) == 1:
+        df = chunks[0]
+    else:
+        df = pd.concat(chunks, ignore_index=True)
+
+    return _standardize_columns(df)
+
+
+def _downcast_numerics(df):
+    """Downcast float64/int64 columns in place to smaller dtypes.
+
+    GPS counts fit in small ints and distances in float32, so
+    season-scale frames move roughly half the bytes through every
+    downstream groupby/ewm/plot pass.
+    """
+    for col in df.select_dtypes("float64").columns:
+        df[col] = pd.to_numeric(df[col], downcast="float")
+    for col in df.select_dtypes("int64").columns:
+        df[col] = pd.to_numeric(df[col], downcast="integer")
+    return df
+
+
+def _standardize_columns(df):
+    """Rename vendor columns and coerce dtypes on a parsed frame."""
     # Common column name mappings for different GPS systems
     column_mappings = {
         # STATSports
@@ -369,7 +584,7 @@ def parse_uploaded_data(uploaded_file):
         "Accels": "Accelerations",
         "Decels": "Decelerations",
         "Dynamic Stress Load": "Player Load (AU)",
-        
+
         # Catapult
         "Athlete Name": "Player",
         "Total Player Load": "Player Load (AU)",
@@ -378,10 +593,23 @@ def parse_uploaded_data(uploaded_file):
         "Acceleration Band 3 Total Effort Count": "Accelerations",
         "Deceleration Band 3 Total Effort Count": "Decelerations"
     }
-    
+
     # Apply mappings
     df = df.rename(columns={k: v for k, v in column_mappings.items() if k in df.columns})
-    
+
+    # Coerce inside the cached function so the parse happens once, and
+    # precompute the ISO week while we're at it
+    if "Date" in df.columns:
+        df["Date"] = pd.to_datetime(df["Date"])
+        df["_week"] = df["Date"].dt.to_period("W")
+
+    # Repeated strings become int codes; categorical group-by keys are
+    # markedly faster than object-dtype strings. Done after any chunk
+    # concatenation so every row shares one category mapping.
+    for col in ("Player", "Position", "Session Type"):
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+
     return df
 
 
@@ -389,6 +617,14 @@ def parse_uploaded_data(uploaded_file):
 # DASHBOARD COMPONENTS
 # =============================================================================
 
+# Content-based DataFrame hashing for the cached figure factories below:
+# identical data reuses the memoized go.Figure instead of reallocating
+# every trace on each rerun.
+_DF_HASH = {
+    pd.DataFrame: lambda d: pd.util.hash_pandas_object(d, index=True).values.tobytes()
+}
+
+
 def render_header():
     """Render the main dashboard header."""
     st.markdown("""
@@ -490,15 +726,34 @@ def render_team_overview(df):
     """Render team overview with key metrics."""
     st.subheader("📈 Team Overview")
     
-    # Calculate team averages for most recent session
-    latest_date = df["Date"].max()
-    latest_df = df[df["Date"] == latest_date]
-    
+    # Calculate team averages for most recent session. df carries a
+    # sorted DatetimeIndex (set in main), so this is a binary-search
+    # slice rather than a full-column equality scan.
+    latest_df = df.loc[df.index[-1]:]
+
+    # One column-parallel aggregation pass instead of six separate
+    # reductions over the same frame
+    stats = latest_df.agg({
+        "Total Distance (m)": "mean",
+        "HSR Distance (m)": "mean",
+        "Sprint Distance (m)": "mean",
+        "Accelerations": "mean",
+        "Player Load (AU)": "mean",
+        "Max Speed (km/h)": "max"
+    })
+
+    # One batched classification for all five benchmarked metrics
+    colors = classify_metrics_batch(
+        stats.iloc[:5].to_numpy(),
+        ["total_distance", "hsr_distance", "sprint_distance",
+         "accel_count", "player_load"]
+    )
+
     col1, col2, col3, col4, col5, col6 = st.columns(6)
-    
+
     with col1:
-        avg_dist = latest_df["Total Distance (m)"].mean()
-        color = get_traffic_light(avg_dist, "total_distance")
+        avg_dist = stats["Total Distance (m)"]
+        color = colors[0]
         st.metric(
             "Avg Distance",
             f"{avg_dist:,.0f}m",
@@ -507,8 +762,8 @@ def render_team_overview(df):
         st.markdown(f'<span class="status-{color}">●</span>', unsafe_allow_html=True)
     
     with col2:
-        avg_hsr = latest_df["HSR Distance (m)"].mean()
-        color = get_traffic_light(avg_hsr, "hsr_distance")
+        avg_hsr = stats["HSR Distance (m)"]
+        color = colors[1]
         st.metric(
             "Avg HSR",
             f"{avg_hsr:,.0f}m",
@@ -517,8 +772,8 @@ def render_team_overview(df):
         st.markdown(f'<span class="status-{color}">●</span>', unsafe_allow_html=True)
     
     with col3:
-        avg_sprint = latest_df["Sprint Distance (m)"].mean()
-        color = get_traffic_light(avg_sprint, "sprint_distance")
+        avg_sprint = stats["Sprint Distance (m)"]
+        color = colors[2]
         st.metric(
             "Avg Sprint",
             f"{avg_sprint:,.0f}m",
@@ -527,8 +782,8 @@ def render_team_overview(df):
         st.markdown(f'<span class="status-{color}">●</span>', unsafe_allow_html=True)
     
     with col4:
-        avg_accel = latest_df["Accelerations"].mean()
-        color = get_traffic_light(avg_accel, "accel_count")
+        avg_accel = stats["Accelerations"]
+        color = colors[3]
         st.metric(
             "Avg Accels",
             f"{avg_accel:.0f}",
@@ -537,8 +792,8 @@ def render_team_overview(df):
         st.markdown(f'<span class="status-{color}">●</span>', unsafe_allow_html=True)
     
     with col5:
-        avg_load = latest_df["Player Load (AU)"].mean()
-        color = get_traffic_light(avg_load, "player_load")
+        avg_load = stats["Player Load (AU)"]
+        color = colors[4]
         st.metric(
             "Avg Load",
             f"{avg_load:.0f} AU",
@@ -547,44 +802,43 @@ def render_team_overview(df):
         st.markdown(f'<span class="status-{color}">●</span>', unsafe_allow_html=True)
     
     with col6:
-        max_speed = latest_df["Max Speed (km/h)"].max()
+        max_speed = stats["Max Speed (km/h)"]
         st.metric(
             "Peak Speed",
             f"{max_speed:.1f} km/h"
         )
 
 
-def render_weekly_load_chart(df):
-    """Render weekly load progression chart."""
-    st.subheader("📊 Weekly Load Progression")
-    
-    # Aggregate by week
-    df["Week"] = df["Date"].dt.isocalendar().week
-    df["Year"] = df["Date"].dt.year
-    df["YearWeek"] = df["Year"].astype(str) + "-W" + df["Week"].astype(str).str.zfill(2)
-    
-    weekly = df.groupby("YearWeek").agg({
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH)
+def _weekly_agg(df):
+    """Aggregate per-week totals, cached on the frame's content.
+
+    The aggregate is identical for all three metric choices, so
+    flipping the metric selectbox reuses it instead of re-running
+    the groupby every rerun.
+    """
+    weekly = df.groupby("_week", sort=True).agg({
         "Total Distance (m)": "sum",
         "HSR Distance (m)": "sum",
         "Player Load (AU)": "sum"
     }).reset_index()
-    
-    # Select metric to display
-    metric = st.selectbox(
-        "Select Metric",
-        ["Total Distance (m)", "HSR Distance (m)", "Player Load (AU)"]
-    )
-    
+    weekly["_week"] = weekly["_week"].astype(str)
+    return weekly
+
+
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH)
+def _build_weekly_fig(weekly, metric):
+    """Build the weekly load bar chart (cached on data + metric)."""
     fig = go.Figure()
-    
+
     # Add bar chart
     fig.add_trace(go.Bar(
-        x=weekly["YearWeek"],
+        x=weekly["_week"],
         y=weekly[metric],
         marker_color="#3b82f6",
         name=metric
     ))
-    
+
     # Add target line
     target = weekly[metric].mean() * 1.1
     fig.add_hline(
@@ -593,48 +847,35 @@ def render_weekly_load_chart(df):
         line_color="#10b981",
         annotation_text="Target +10%"
     )
-    
+
     fig.update_layout(
+        template="sourced",
         height=400,
-        margin=dict(l=20, r=20, t=40, b=20),
-        plot_bgcolor="rgba(0,0,0,0)",
-        paper_bgcolor="rgba(0,0,0,0)",
-        font=dict(color="#e2e8f0"),
-        xaxis=dict(gridcolor="#334155"),
-        yaxis=dict(gridcolor="#334155")
+        margin=dict(l=20, r=20, t=40, b=20)
     )
-    
-    st.plotly_chart(fig, use_container_width=True)
 
+    return fig
 
-def render_acwr_monitor(df):
-    """Render ACWR monitoring chart."""
-    st.subheader("⚠️ Acute:Chronic Workload Ratio")
-    
-    # Calculate weekly totals per player
-    df["Week"] = df["Date"].dt.isocalendar().week
-    
-    weekly_player = df.groupby(["Player", "Week"])["Player Load (AU)"].sum().reset_index()
-    
-    # Calculate ACWR for each player (most recent)
-    acwr_data = []
-    for player in df["Player"].unique():
-        player_weeks = weekly_player[weekly_player["Player"] == player].sort_values("Week")
-        weekly_loads = player_weeks["Player Load (AU)"].tolist()
-        
-        acwr = calculate_acwr(weekly_loads)
-        if acwr:
-            status_color, status_text = get_acwr_status(acwr)
-            acwr_data.append({
-                "Player": player,
-                "ACWR": acwr,
-                "Status": status_text,
-                "Color": status_color
-            })
-    
-    acwr_df = pd.DataFrame(acwr_data).sort_values("ACWR", ascending=False)
-    
-    # Create horizontal bar chart
+
+def render_weekly_load_chart(df):
+    """Render weekly load progression chart."""
+    st.subheader("📊 Weekly Load Progression")
+
+    # Aggregate by the precomputed week column, memoized per dataset
+    weekly = _weekly_agg(df)
+
+    # Select metric to display
+    metric = st.selectbox(
+        "Select Metric",
+        ["Total Distance (m)", "HSR Distance (m)", "Player Load (AU)"]
+    )
+
+    st.plotly_chart(_build_weekly_fig(weekly, metric), use_container_width=True, theme=None)
+
+
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH)
+def _build_acwr_fig(acwr_df):
+    """Build the ACWR horizontal bar chart (cached on data)."""
     colors = acwr_df["Color"].map({
         "green": "#10b981",
         "yellow": "#f59e0b",
@@ -642,9 +883,9 @@ def render_acwr_monitor(df):
         "red": "#ef4444",
         "gray": "#6b7280"
     }).tolist()
-    
+
     fig = go.Figure()
-    
+
     fig.add_trace(go.Bar(
         y=acwr_df["Player"],
         x=acwr_df["ACWR"],
@@ -653,7 +894,7 @@ def render_acwr_monitor(df):
         text=acwr_df["ACWR"].round(2),
         textposition="outside"
     ))
-    
+
     # Add optimal zone
     fig.add_vrect(
         x0=0.8, x1=1.3,
@@ -663,26 +904,85 @@ def render_acwr_monitor(df):
         annotation_text="Optimal Zone",
         annotation_position="top"
     )
-    
+
     # Add danger zones
     fig.add_vrect(x0=0, x1=0.6, fillcolor="#ef4444", opacity=0.1, line_width=0)
     fig.add_vrect(x0=1.5, x1=2.0, fillcolor="#ef4444", opacity=0.1, line_width=0)
-    
+
     fig.update_layout(
+        template="sourced",
         height=max(400, len(acwr_df) * 25),
         margin=dict(l=20, r=20, t=40, b=20),
-        plot_bgcolor="rgba(0,0,0,0)",
-        paper_bgcolor="rgba(0,0,0,0)",
-        font=dict(color="#e2e8f0"),
         xaxis=dict(
-            gridcolor="#334155",
             range=[0, 2],
             title="ACWR"
-        ),
-        yaxis=dict(gridcolor="#334155")
+        )
     )
+
+    return fig
+
+
+def render_acwr_monitor(df):
+    """Render ACWR monitoring chart."""
+    st.subheader("⚠️ Acute:Chronic Workload Ratio")
     
-    st.plotly_chart(fig, use_container_width=True)
+    # Weekly totals per player, keyed on the precomputed week column
+    weekly_player = (
+        df.groupby(["Player", "_week"], observed=True)["Player Load (AU)"]
+        .sum()
+        .reset_index()
+    )
+
+    # Calculate ACWR for all players in one vectorized pass:
+    # pivot to (weeks x players), run the EWMA recurrence once in
+    # pandas, then take acute (latest week) over chronic (EWMA).
+    chronic_weeks = 4
+    chronic_lambda = 2 / (chronic_weeks * 7 + 1)
+
+    wide = weekly_player.pivot(
+        index="_week", columns="Player", values="Player Load (AU)"
+    ).sort_index()
+
+    if _HAS_NUMBA:
+        # JIT path: run the recurrence in parallel over a contiguous
+        # (n_players, n_weeks) matrix, no GIL, no pandas overhead
+        loads = np.ascontiguousarray(wide.to_numpy(dtype=np.float64).T)
+        acwr = pd.Series(_acwr_batch(loads, chronic_lambda), index=wide.columns)
+    else:
+        # ignore_na=True skips missing weeks outright, the same
+        # recurrence the batch kernel runs
+        chronic = wide.ewm(alpha=chronic_lambda, adjust=False, ignore_na=True).mean()
+        acwr = wide.iloc[-1] / chronic.iloc[-1]
+    acwr = acwr.dropna()
+
+    # Need at least the chronic window of data, same as calculate_acwr
+    acwr = acwr[wide.notna().sum() >= chronic_weeks]
+
+    # Vectorized status mapping over the ACWR zone bounds
+    values = acwr.to_numpy()
+    conditions = [
+        (values >= ACWR_ZONES["green"][0]) & (values <= ACWR_ZONES["green"][1]),
+        (values >= ACWR_ZONES["yellow_low"][0]) & (values < ACWR_ZONES["green"][0]),
+        (values > ACWR_ZONES["green"][1]) & (values <= ACWR_ZONES["yellow_high"][1]),
+        values < ACWR_ZONES["red_low"],
+    ]
+    statuses = np.select(
+        conditions,
+        ["Optimal", "Undertraining", "High Load", "Detraining Risk"],
+        default="Injury Risk"
+    )
+    status_colors = np.select(
+        conditions, ["green", "yellow", "yellow", "red"], default="red"
+    )
+
+    acwr_df = pd.DataFrame({
+        "Player": acwr.index,
+        "ACWR": values,
+        "Status": statuses,
+        "Color": status_colors
+    }).sort_values("ACWR", ascending=False)
+
+    st.plotly_chart(_build_acwr_fig(acwr_df), use_container_width=True, theme=None)
     
     # Summary stats
     col1, col2, col3, col4 = st.columns(4)
@@ -704,6 +1004,44 @@ def render_acwr_monitor(df):
         st.metric("Team Avg ACWR", f"{avg_acwr:.2f}")
 
 
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH)
+def _build_comparison_fig(normalized, selected_players):
+    """Build the player comparison radar chart (cached on data)."""
+    metrics = normalized.columns.tolist()
+
+    fig = go.Figure()
+
+    colors = ["#3b82f6", "#10b981", "#f59e0b", "#ef4444", "#8b5cf6"]
+
+    for i, player in enumerate(selected_players):
+        values = normalized.loc[player].tolist()
+        values.append(values[0])  # Close the polygon
+
+        fig.add_trace(go.Scatterpolar(
+            r=values,
+            theta=metrics + [metrics[0]],
+            fill="toself",
+            name=player,
+            line_color=colors[i % len(colors)],
+            opacity=0.7
+        ))
+
+    fig.update_layout(
+        template="sourced",
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, 100]
+            )
+        ),
+        showlegend=True,
+        height=500,
+        margin=dict(l=60, r=60, t=40, b=40)
+    )
+
+    return fig
+
+
 def render_player_comparison(df):
     """Render player comparison radar chart."""
     st.subheader("👥 Player Comparison")
@@ -726,50 +1064,23 @@ def render_player_comparison(df):
                "Accelerations", "Decelerations", "Player Load (AU)"]
     
     # Normalize to percentage of max for radar chart
-    player_data = df[df["Player"].isin(selected_players)].groupby("Player")[metrics].mean()
-    
-    # Normalize
-    normalized = player_data.copy()
-    for col in metrics:
-        max_val = player_data[col].max()
-        if max_val > 0:
-            normalized[col] = (player_data[col] / max_val) * 100
-    
-    # Create radar chart
-    fig = go.Figure()
-    
-    colors = ["#3b82f6", "#10b981", "#f59e0b", "#ef4444", "#8b5cf6"]
-    
-    for i, player in enumerate(selected_players):
-        values = normalized.loc[player].tolist()
-        values.append(values[0])  # Close the polygon
-        
-        fig.add_trace(go.Scatterpolar(
-            r=values,
-            theta=metrics + [metrics[0]],
-            fill="toself",
-            name=player,
-            line_color=colors[i % len(colors)],
-            opacity=0.7
-        ))
-    
-    fig.update_layout(
-        polar=dict(
-            radialaxis=dict(
-                visible=True,
-                range=[0, 100],
-                gridcolor="#334155"
-            ),
-            bgcolor="rgba(0,0,0,0)"
-        ),
-        showlegend=True,
-        height=500,
-        margin=dict(l=60, r=60, t=40, b=40),
-        paper_bgcolor="rgba(0,0,0,0)",
-        font=dict(color="#e2e8f0")
+    player_data = (
+        df[df["Player"].isin(selected_players)]
+        .groupby("Player", observed=True)[metrics]
+        .mean()
     )
     
-    st.plotly_chart(fig, use_container_width=True)
+    # Normalize to percent-of-max in one broadcast division; metrics
+    # whose max is 0 stay at 0 instead of dividing by zero
+    maxes = player_data.max(axis=0)
+    normalized = player_data.div(maxes.replace(0, np.nan), axis=1) * 100
+    normalized = normalized.fillna(0)
+
+    st.plotly_chart(
+        _build_comparison_fig(normalized, tuple(selected_players)),
+        use_container_width=True,
+        theme=None
+    )
 
 
 def render_individual_player(df):
@@ -782,7 +1093,7 @@ def render_individual_player(df):
         key="individual_player"
     )
     
-    player_df = df[df["Player"] == selected_player].sort_values("Date")
+    player_df = _group_by_player(df)[selected_player].sort_values("Date")
     
     # Player stats
     col1, col2, col3 = st.columns(3)
@@ -806,9 +1117,10 @@ def render_individual_player(df):
     
     fig = make_subplots(rows=2, cols=1, shared_xaxes=True, vertical_spacing=0.1)
     
-    # Total Distance trend
+    # Total Distance trend (Scattergl renders via WebGL, so large
+    # uploaded datasets don't hit the SVG point ceiling)
     fig.add_trace(
-        go.Scatter(
+        go.Scattergl(
             x=player_df["Date"],
             y=player_df["Total Distance (m)"],
             mode="lines+markers",
@@ -821,7 +1133,7 @@ def render_individual_player(df):
     
     # Player Load trend
     fig.add_trace(
-        go.Scatter(
+        go.Scattergl(
             x=player_df["Date"],
             y=player_df["Player Load (AU)"],
             mode="lines+markers",
@@ -833,27 +1145,41 @@ def render_individual_player(df):
     )
     
     fig.update_layout(
+        template="sourced",
         height=400,
         margin=dict(l=20, r=20, t=20, b=20),
-        plot_bgcolor="rgba(0,0,0,0)",
-        paper_bgcolor="rgba(0,0,0,0)",
-        font=dict(color="#e2e8f0"),
         showlegend=True,
         legend=dict(orientation="h", yanchor="bottom", y=1.02)
     )
-    
-    fig.update_xaxes(gridcolor="#334155")
-    fig.update_yaxes(gridcolor="#334155")
-    
-    st.plotly_chart(fig, use_container_width=True)
+
+    st.plotly_chart(fig, use_container_width=True, theme=None)
+
+
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH)
+def _to_csv_bytes(df):
+    """Serialize the export frame to CSV bytes, cached on content.
+
+    st.download_button evaluates its payload eagerly on every rerun
+    even if the user never clicks, so the stringification pass is
+    memoized.
+    """
+    return df.to_csv(index=False).encode()
+
+
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH)
+def _to_parquet_bytes(df):
+    """Serialize the export frame to parquet bytes, cached on content."""
+    buf = io.BytesIO()
+    df.to_parquet(buf, engine="pyarrow", compression="snappy", index=False)
+    return buf.getvalue()
 
 
 def render_data_table(df):
     """Render full data table with export option."""
     st.subheader("📋 Raw Data")
     
-    # Show/hide columns
-    all_columns = df.columns.tolist()
+    # Show/hide columns (internal helper columns stay hidden)
+    all_columns = [c for c in df.columns if not c.startswith("_")]
     selected_columns = st.multiselect(
         "Select columns to display",
         all_columns,
@@ -866,14 +1192,29 @@ def render_data_table(df):
         height=400
     )
     
-    # Export button
-    csv = df.to_csv(index=False)
-    st.download_button(
-        label="📥 Download CSV",
-        data=csv,
-        file_name=f"gps_data_export_{datetime.now().strftime('%Y%m%d')}.csv",
-        mime="text/csv"
-    )
+    # Export buttons (payloads are cached so reruns skip serialization)
+    export_df = df[selected_columns]
+    export_stamp = datetime.now().strftime('%Y%m%d')
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.download_button(
+            label="📥 Download CSV",
+            data=_to_csv_bytes(export_df),
+            file_name=f"gps_data_export_{export_stamp}.csv",
+            mime="text/csv"
+        )
+
+    with col2:
+        # Parquet is ~5x smaller and far faster to write than CSV
+        if _HAS_PYARROW:
+            st.download_button(
+                label="📥 Download Parquet",
+                data=_to_parquet_bytes(export_df),
+                file_name=f"gps_data_export_{export_stamp}.parquet",
+                mime="application/octet-stream"
+            )
 
 
 # =============================================================================
@@ -896,9 +1237,19 @@ def main():
         st.warning("No data available. Please upload a CSV file or use demo data.")
         return
     
-    # Ensure Date is datetime
+    # Ensure Date is datetime; _week is normally precomputed by the
+    # cached loaders, so only derive it for frames that lack it
     if "Date" in df.columns:
         df["Date"] = pd.to_datetime(df["Date"])
+        if "_week" not in df.columns:
+            df["_week"] = df["Date"].dt.to_period("W")
+
+        # Sort by date and index on it so date selections use
+        # binary-search slicing instead of full-column equality scans.
+        # Date stays available as a column (drop=False) and the index
+        # is left unnamed so "Date" labels stay unambiguous.
+        df = df.sort_values("Date").set_index("Date", drop=False)
+        df.index.name = None
     
     # Main content tabs
     tab1, tab2, tab3, tab4, tab5 = st.tabs([